@@ -12,7 +12,7 @@ import psutil
 
 from discord_nowplaying_integration.nowplaying import NowPlayingNotifier
 from discord_nowplaying_integration.selfbot import Selfbot
-from discord_nowplaying_integration.utils import Formatter, IS_LINUX, IS_MACOSX, IS_WINDOWS, Queue, RateLimiter
+from discord_nowplaying_integration.utils import either, Formatter, IS_LINUX, IS_MACOSX, IS_WINDOWS, Queue, RateLimiter
 
 if IS_WINDOWS:
     from time import sleep
@@ -25,7 +25,7 @@ else:
 
 __all__ = (
     'APP_DATA_ABSDIRPATH', 'PROC_NAMES', 'PROC_NAMES_TO_EXPECTED_PATHS',
-    'running_discord_desktop_apps', 'spawn_selfbots',
+    'has_open_file_under', 'running_discord_desktop_apps', 'spawn_selfbots',
     'configure_logging', 'run_client', 'run_main_event_loop', 'main',
 )
 
@@ -55,12 +55,34 @@ PROC_NAMES_TO_EXPECTED_PATHS = dict(zip(PROC_NAMES, (
 
 ################################################################################################################################################################
 
+if IS_LINUX:
+    def has_open_file_under(proc, dirpath):
+        # Rather than have ``Process.open_files`` resolve every last FD, resolve them ourselves, stopping at the first hit…
+        try:
+            with os.scandir('/proc/{0:d}/fd'.format(proc.pid)) as entries:
+                for entry in entries:
+                    try:
+                        if os.readlink(entry.path).startswith(dirpath):
+                            return True
+                    except OSError:
+                        continue  # The FD was closed from under us.
+        except OSError:
+            pass  # The process died, or isn't ours to inspect.
+        return False
+else:
+    def has_open_file_under(proc, dirpath):
+        return any(f.path.startswith(dirpath) for f in proc.open_files())
+
+
 async def running_discord_desktop_apps(terminating):
     while not terminating.is_set():
-        candidates = tuple((p, PROC_NAMES_TO_EXPECTED_PATHS[p.name()]) for p in psutil.process_iter() if (
-            (p.name() in PROC_NAMES) and
-            ((p.parent() is None) or (p.parent().name() not in PROC_NAMES))
-        ))  # Theoretical race; retval of ``Process.name`` is not cached on POSIX.
+        # Snapshot every process' name and parent PID in a single sweep, rather than querying them piecemeal…
+        procs = tuple(psutil.process_iter(attrs=('name', 'ppid')))
+        proc_names = {p.pid: p.info['name'] for p in procs}
+        candidates = tuple((p, PROC_NAMES_TO_EXPECTED_PATHS[p.info['name']]) for p in procs if (
+            (p.info['name'] in PROC_NAMES_TO_EXPECTED_PATHS) and
+            (proc_names.get(p.info['ppid']) not in PROC_NAMES_TO_EXPECTED_PATHS)
+        ))
         if len(candidates) != 1:
             logger.warning('Could not find exactly one running Discord desktop app process; backing off…')
             try:
@@ -70,7 +92,7 @@ async def running_discord_desktop_apps(terminating):
                 continue
         (proc, (user_data_absdirpath, db_relfilepath)) = candidates[0]
 
-        if not any(f.path.startswith(user_data_absdirpath) for f in proc.open_files()):
+        if not has_open_file_under(proc, user_data_absdirpath):
             logger.warning('Could not find any open file handles in the expected ``userData`` directory for the running Discord desktop app process; backing off…')
             try:
                 await asyncio.wait_for(terminating.wait(), 10)
@@ -81,9 +103,7 @@ async def running_discord_desktop_apps(terminating):
         db_uri = urlunsplit(SplitResult(scheme='file', netloc='', path=(user_data_absdirpath + db_relfilepath), query='mode=ro', fragment=''))
         try:
             with closing(sqlite3.connect(db_uri, uri=True)) as con:
-                with closing(con.cursor()) as cur:
-                    cur.execute('select value from ItemTable where key = ?', ('token',))
-                    row = cur.fetchone()
+                row = con.execute('select value from ItemTable where key = ?', ('token',)).fetchone()
             assert row is not None
             json_token = row[0].decode('utf-16-le')
             token = json.loads(json_token)
@@ -102,20 +122,21 @@ async def running_discord_desktop_apps(terminating):
 async def spawn_selfbots(terminating, queue):
     loop = asyncio.get_event_loop()
     async for (proc, token) in running_discord_desktop_apps(terminating):
-        logger.info('Identified Discord desktop app process with PID = {0:d}; spawning selfbot…'.format(proc.pid))
+        logger.info('Identified Discord desktop app process with PID = %d; spawning selfbot…', proc.pid)
         selfbot = Selfbot(queue)
         task = loop.create_task(selfbot.start(token, bot=False))
         await selfbot.wait_until_ready()
 
+        # Block on the process in a dedicated thread for as long as it takes, rather than churning through the executor on a timeout…
+        proc_died = asyncio.Event(loop=loop)
+
         def wait_for_proc():
-            proc.wait(timeout=2)
+            proc.wait()
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(proc_died.set)
         logger.info('Waiting for Discord desktop app process to die…')
-        while not terminating.is_set():
-            try:
-                await loop.run_in_executor(None, wait_for_proc)
-                break
-            except psutil.TimeoutExpired:
-                pass
+        threading.Thread(target=wait_for_proc, name='DiscordProcessWaiterThread', daemon=True).start()
+        await either(proc_died.wait(), terminating.wait())
 
         logger.info('Destroying selfbot…')
         await asyncio.wait((selfbot.logout(), task))
@@ -1,8 +1,8 @@
-from collections import OrderedDict
 import logging
 import threading
 
 from discord_nowplaying_integration.nowplaying.observers import OBSERVERS
+from discord_nowplaying_integration.utils import format_status_message
 
 __all__ = ('NowPlayingNotifier',)
 
@@ -15,13 +15,14 @@ logger = logging.getLogger(__name__)
 ################################################################################################################################################################
 
 class NowPlayingNotifier:
-    __slots__ = ('_queue', '_mapping', '_observers', '_lock')
+    __slots__ = ('_queue', '_mapping', '_current_track', '_lock', '_observers')
 
     def __init__(self, queue):
         self._queue = queue
-        self._mapping = OrderedDict()
-        self._observers = tuple(O(self) for O in OBSERVERS)
-        self._lock = threading.RLock()
+        self._mapping = {}  # Insertion-ordered; the first player to start playing wins.
+        self._current_track = None
+        self._lock = threading.Lock()
+        self._observers = tuple(O(self) for O in OBSERVERS)  # Observers may well notify us as they're constructed.
 
     def close(self):
         for observer in self._observers:
@@ -29,18 +30,23 @@ class NowPlayingNotifier:
 
     @property
     def current_track(self):
-        with self._lock:
-            return (next(iter(self._mapping.values())) if self._mapping else None)
+        # Only ever rebound (atomically) under the lock, so readers needn't take it…
+        return self._current_track
 
     def notify(self, player, track):
         with self._lock:
-            old_track = self.current_track
+            # Players are wont to repeat themselves; if nothing's changed, there's nothing to do…
+            if self._mapping.get(player) == track:
+                return
+            old_track = self._current_track
             if track is None:
                 if player in self._mapping:
                     del self._mapping[player]
             else:
                 self._mapping[player] = track
-            new_track = self.current_track
+            self._current_track = new_track = (next(iter(self._mapping.values())) if self._mapping else None)
             if new_track != old_track:
-                logger.info('Pushing {0!r:s} onto the queue…'.format(new_track))
-                self._queue.put(new_track)
+                # Format on the notifying thread, so the event loop only ever deals in ready-made status messages…
+                status_message = format_status_message(*new_track) if new_track else None
+                logger.info('Pushing %r onto the queue…', status_message)
+                self._queue.put(status_message)
@@ -37,7 +37,7 @@ def is_itunes_running():
     return (
         FindWindowW('iTunesApp', 'iTunes') and
         FindWindowW('iTunes', 'iTunes') and
-        any((p.name() == 'iTunes.exe') for p in psutil.process_iter())
+        any((p.info['name'] == 'iTunes.exe') for p in psutil.process_iter(attrs=('name',)))
     )
 
 
@@ -69,7 +69,7 @@ class ITunesObserver:
     def update(self, track):
         if self._app.PlayerState == ITUNES_PLAYER_STATE_PLAYING:
             (artist, title) = (track.Artist, track.Name)
-            logger.info('«iTunes» notified us that it is now playing «{0:s}» by «{1:s}»…'.format(title, artist))
+            logger.info('«iTunes» notified us that it is now playing «%s» by «%s»…', title, artist)
             self._npn.notify(ITUNES_PLAYER, (artist, title))
         elif self._app.PlayerState == ITUNES_PLAYER_STATE_STOPPED:
             logger.info('«iTunes» notified us that it is no longer playing anything…')
@@ -31,35 +31,58 @@ METADATA_TITLE_KEY = 'xesam:title'
 ################################################################################################################################################################
 
 class PlayerObserver:
-    __slots__ = ('_npn', '_owner', '_player', '_handle')
+    __slots__ = ('_npn', '_owner', '_player', '_playback_status', '_metadata', '_track', '_handle')
 
     def __init__(self, npn, bus, owner):
         self._npn = npn
         self._owner = owner
         self._player = bus.get(owner, OBJECT_PATH)
+        self._playback_status = None
+        self._metadata = None
+        self._track = None
 
         def handler(iface, changed, invalidated):
-            if any(p in changed.keys() for p in (METADATA_PROP, PLAYBACK_STATUS_PROP)):
+            # Invalidated properties must be fetched afresh; the rest are either in ``changed``, or haven't changed…
+            if PLAYBACK_STATUS_PROP in invalidated:
+                self._playback_status = None
+            if METADATA_PROP in invalidated:
+                self._metadata = None
+            if any((p in changed.keys()) or (p in invalidated) for p in (METADATA_PROP, PLAYBACK_STATUS_PROP)):
                 self.update(playback_status=changed.get(PLAYBACK_STATUS_PROP), metadata=changed.get(METADATA_PROP))
-        logger.info('Subscribing to «org.freedesktop.DBus.Properties.PropertiesChanged» on «{0:s}»…'.format(owner))
+        logger.info('Subscribing to «org.freedesktop.DBus.Properties.PropertiesChanged» on «%s»…', owner)
         self._handle = self._player.PropertiesChanged.connect(handler)
 
         self.update()
 
     def update(self, playback_status=None, metadata=None):
-        playback_status = playback_status or self._player.PlaybackStatus
+        # Remember what we're told, so we only go back to the player (synchronously) for what we've yet to see…
+        if playback_status is not None:
+            self._playback_status = playback_status
+        if metadata is not None:
+            self._metadata = metadata
+        if self._playback_status is None:
+            self._playback_status = self._player.PlaybackStatus
+        playback_status = self._playback_status
         if playback_status == PLAYING_STATUS:
-            metadata = metadata or self._player.Metadata
+            if self._metadata is None:
+                self._metadata = self._player.Metadata
+            metadata = self._metadata
             (artist, title) = (metadata[METADATA_ARTIST_KEY][0], metadata[METADATA_TITLE_KEY])
-            logger.info('«{0:s}» notified us that it is now playing «{1:s}» by «{2:s}»…'.format(self._owner, title, artist))
+            if (artist, title) == self._track:
+                return
+            self._track = (artist, title)
+            logger.info('«%s» notified us that it is now playing «%s» by «%s»…', self._owner, title, artist)
             self._npn.notify(self._owner, (artist, title))
         else:
             assert playback_status in NON_PLAYING_STATUSES
-            logger.info('«{0:s}» notified us that it is no longer playing anything…'.format(self._owner))
+            if self._track is None:
+                return
+            self._track = None
+            logger.info('«%s» notified us that it is no longer playing anything…', self._owner)
             self._npn.notify(self._owner, None)
 
     def close(self):
-        logger.info('Unsubscribing from «org.freedesktop.DBus.Properties.PropertiesChanged» on «{0:s}»…'.format(self._owner))
+        logger.info('Unsubscribing from «org.freedesktop.DBus.Properties.PropertiesChanged» on «%s»…', self._owner)
         self._handle.unsubscribe()
 
         self.update(playback_status='Stopped')
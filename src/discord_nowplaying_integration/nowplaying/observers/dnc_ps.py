@@ -34,11 +34,11 @@ def handle_generic_notification(npn, player, notification):
     state = ui.objectForKey_(NUI_STATE_KEY)
     if state == PLAYING_STATE:
         (artist, title) = (ui.objectForKey_(NUI_ARTIST_KEY), ui.objectForKey_(NUI_TITLE_KEY))
-        logger.info('«{0:s}» notified us that it is now playing «{1:s}» by «{2:s}»…'.format(player, title, artist))
+        logger.info('«%s» notified us that it is now playing «%s» by «%s»…', player, title, artist)
         npn.notify(player, (artist, title))
     else:
         assert state in NON_PLAYING_STATES
-        logger.info('«{0:s}» notified us that it is no longer playing anything…'.format(player))
+        logger.info('«%s» notified us that it is no longer playing anything…', player)
         npn.notify(player, None)
 
 
@@ -46,16 +46,15 @@ class PlaybackStateObserver(NSObject):
     def initWithNotifier_(self, npn):
         self = super().init()
         self._npn = npn
+        self._dnc = NSDistributedNotificationCenter.defaultCenter()  # Hang on to it, so we're sure to remove ourselves from the very same center.
         logger.info('Adding observers…')
-        dnc = NSDistributedNotificationCenter.defaultCenter()
-        dnc.addObserver_selector_name_object_(self, 'iTunesPlaybackStateChanged:', 'com.apple.iTunes.playerInfo', None)
-        dnc.addObserver_selector_name_object_(self, 'spotifyPlaybackStateChanged:', 'com.spotify.client.PlaybackStateChanged', None)
+        self._dnc.addObserver_selector_name_object_(self, 'iTunesPlaybackStateChanged:', 'com.apple.iTunes.playerInfo', None)
+        self._dnc.addObserver_selector_name_object_(self, 'spotifyPlaybackStateChanged:', 'com.spotify.client.PlaybackStateChanged', None)
         return self
 
     def dealloc(self):
         logger.info('Removing observers…')
-        dnc = NSDistributedNotificationCenter.defaultCenter()
-        dnc.removeObserver_(self)
+        self._dnc.removeObserver_(self)
         return super().dealloc()
 
     def iTunesPlaybackStateChanged_(self, aNotification):
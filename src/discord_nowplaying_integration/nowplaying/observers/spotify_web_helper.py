@@ -1,8 +1,6 @@
 from json.decoder import JSONDecodeError
 import logging
-from random import choices
-from socket import SOCK_STREAM
-from string import ascii_lowercase
+from secrets import token_hex
 import threading
 
 import psutil
@@ -10,7 +8,7 @@ from psutil import CONN_LISTEN
 import requests
 from requests.exceptions import ConnectionError, Timeout
 
-__all__ = ('wait_for_helper', 'connect_to_helper', 'SpotifyWebHelperObserver')
+__all__ = ('is_spotify_web_helper', 'wait_for_helper', 'connect_to_helper', 'SpotifyWebHelperObserver')
 
 
 ################################################################################################################################################################
@@ -20,15 +18,20 @@ logger = logging.getLogger(__name__)
 
 ################################################################################################################################################################
 
+def is_spotify_web_helper(pid):
+    try:
+        return (pid is not None) and (psutil.Process(pid).name() == 'SpotifyWebHelper.exe')
+    except psutil.Error:
+        return False  # The process died, or isn't ours to inspect.
+
+
 def wait_for_helper(npn, terminating):
+    backoff = 0
     while not terminating.is_set():
-        candidate_ports = frozenset(
-            conn.laddr[1]
-            for proc in psutil.process_iter() if (
-                proc.name() == 'SpotifyWebHelper.exe'
-            )
-            for conn in proc.connections() if (
-                (conn.type == SOCK_STREAM) and
+        # A single system-wide sweep of TCP sockets beats asking each and every process for its connections…
+        conns = tuple(
+            conn
+            for conn in psutil.net_connections(kind='tcp4') if (
                 (conn.status == CONN_LISTEN) and
                 (conn.raddr == ()) and
                 (conn.laddr[0] == '127.0.0.1') and
@@ -36,47 +39,57 @@ def wait_for_helper(npn, terminating):
                 (conn.laddr[1] <= 4379)
             )
         )
+        # … leaving us to look up the names of just the handful of processes listening on the right ports…
+        helper_pids = frozenset(pid for pid in frozenset(conn.pid for conn in conns) if is_spotify_web_helper(pid))
+        candidate_ports = frozenset(conn.laddr[1] for conn in conns if (conn.pid in helper_pids))
         for port in candidate_ports:
             if connect_to_helper(npn, terminating, port):
                 break  # We're exiting cleanly; no need to test further ports or back off…
         else:
-            terminating.wait(2)  # No successful connections were established; back off…
+            # No successful connections were established; back off (and if there's no helper to be found at all, increasingly so)…
+            backoff = min(backoff * 2, 30) if (backoff and not candidate_ports) else 2
+            terminating.wait(backoff)
 
 
 def connect_to_helper(npn, terminating, port):
     player_name = 'Spotify Web Helper via port {0:d}'.format(port)
-    subdomain = ''.join(choices(ascii_lowercase, k=10))
+    subdomain = token_hex(5)  # Any subdomain resolves to localhost; we use a fresh one per connection to keep clear of any stale state.
     base_url = 'https://{0:s}.spotilocal.com:{1:d}'.format(subdomain, port)
     token_url = '{0:s}/simplecsrf/token.json'.format(base_url)
     status_url = '{0:s}/remote/status.json'.format(base_url)
     headers = {'Origin': 'https://open.spotify.com'}
+    session = requests.Session()  # Keep connections alive across requests, rather than handshaking (TLS and all) every time…
 
-    logger.info('«{0:s}» will try RPC…'.format(player_name))
+    logger.info('«%s» will try RPC…', player_name)
     try:
-        # We can only get a token if Spotify's running…
+        # We can only get a token if Spotify's running; the longer it isn't, the less often we'll ask…
+        backoff = 2
         while not terminating.is_set():
-            response = requests.get(token_url, headers=headers, timeout=(3.5, 6.5)).json()
+            response = session.get(token_url, headers=headers, timeout=(3.5, 6.5)).json()
             if 'token' in response:
                 csrf = response['token']
                 break
             else:
-                terminating.wait(2)
+                terminating.wait(backoff)
+                backoff = min(backoff * 2, 30)
         else:
-            logger.info('«{0:s}» is bailing…'.format(player_name))
+            logger.info('«%s» is bailing…', player_name)
             return True
-        oauth = requests.get('https://open.spotify.com/token', timeout=(3.5, 6.5)).json()['t']
-        logger.info('«{0:s}» can RPC…'.format(player_name))
-
-        return_after = 0
+        oauth = session.get('https://open.spotify.com/token', timeout=(3.5, 6.5)).json()['t']
+        logger.info('«%s» can RPC…', player_name)
+
+        # The first status request returns straight away; every one thereafter long-polls for changes…
+        params = {
+            'csrf': csrf,
+            'oauth': oauth,
+            'returnafter': 0,
+            'returnon': '',
+        }
         old_track = None
         while not terminating.is_set():
-            status = requests.get(status_url, params={
-                'csrf': csrf,
-                'oauth': oauth,
-                'returnafter': return_after,
-                'returnon': 'login,logout,play,pause,error,ap' if return_after else '',
-            }, headers=headers, timeout=(3.5, return_after + 6.5)).json()
-            return_after = 60
+            status = session.get(status_url, params=params, headers=headers, timeout=(3.5, params['returnafter'] + 6.5)).json()
+            params['returnafter'] = 60
+            params['returnon'] = 'login,logout,play,pause,error,ap'
             if not status.get('running', False):
                 terminating.wait(2)
                 continue
@@ -87,18 +100,19 @@ def connect_to_helper(npn, terminating, port):
                 new_track = None
             if new_track != old_track:
                 if new_track is not None:
-                    logger.info('«{0:s}» notified us that it is now playing «{0:s}» by «{1:s}»…'.format(player_name, title, artist))
+                    logger.info('«%s» notified us that it is now playing «%s» by «%s»…', player_name, title, artist)
                     npn.notify(player_name, new_track)
                 else:
-                    logger.info('«{0:s}» notified us that it is no longer playing anything…'.format(player_name))
+                    logger.info('«%s» notified us that it is no longer playing anything…', player_name)
                     npn.notify(player_name, None)
                 old_track = new_track
-        logger.info('«{0:s}» is bailing…'.format(player_name))
+        logger.info('«%s» is bailing…', player_name)
         return True
     except (ConnectionError, Timeout, JSONDecodeError, KeyError) as e:
-        logger.info('«{0:s}» RPC failed…'.format(player_name), exc_info=e)
+        logger.info('«%s» RPC failed…', player_name, exc_info=e)
         return False
     finally:
+        session.close()
         npn.notify(player_name, None)
 
 
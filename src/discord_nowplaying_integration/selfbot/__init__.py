@@ -1,10 +1,9 @@
+import asyncio
 import logging
 from types import MethodType
 
 import discord
 
-from discord_nowplaying_integration.utils import either, format_status_message
-
 __all__ = (
     'patch_parse_ready', 'patch_parse_user_settings_update',
     'Selfbot',
@@ -40,7 +39,7 @@ def patch_parse_user_settings_update(client):
             old_user_status = client.user_status
             client.user_status = new_user_status = str(data['status'])
             # I wonder whether the rate limit for presence updates applies at the client or user level…
-            logger.info('Observed user status change from {0:s} to {1:s}…'.format(old_user_status, new_user_status))
+            logger.info('Observed user status change from %s to %s…', old_user_status, new_user_status)
 
     cs.parse_user_settings_update = MethodType(new_parse_user_settings_update, cs)
 
@@ -57,14 +56,25 @@ class Selfbot(discord.Client):
 
         async def update_presence():
             await self.wait_until_ready()
-            while not self.is_closed:
-                ((got_nowplaying_state, nowplaying_state), (_, _)) = await either(queue.get(), self._closed.wait())
-                if not got_nowplaying_state:
-                    continue
-                game = discord.Game(name=format_status_message(*nowplaying_state), type=2) if nowplaying_state else None
-                logger.info('Will set game to «{0!s:s}» (with {1:s} status)…'.format(game, self.user_status) if game else 'Will clear game (with {0:s} status)…'.format(self.user_status))
-                await self.change_presence(game=game, status=self.user_status)
+            # One long-lived task will do to watch for closure, rather than spinning up (and tearing down) a fresh one per status message…
+            closed_task = self.loop.create_task(self._closed.wait())
+            try:
+                while not self.is_closed:
+                    get_task = self.loop.create_task(queue.get())
+                    await asyncio.wait((get_task, closed_task), loop=self.loop, return_when=asyncio.FIRST_COMPLETED)
+                    if not get_task.done():
+                        get_task.cancel()
+                        continue
+                    status_message = get_task.result()
+                    game = discord.Game(name=status_message, type=2) if status_message else None
+                    if game:
+                        logger.info('Will set game to «%s» (with %s status)…', game, self.user_status)
+                    else:
+                        logger.info('Will clear game (with %s status)…', self.user_status)
+                    await self.change_presence(game=game, status=self.user_status)
+            finally:
+                closed_task.cancel()
         self.loop.create_task(update_presence())
 
     async def on_ready(self):
-        logger.info('Logged in as {0!s:s} (with {1:s} status); ID = {2:s}…'.format(self.user, self.user_status, self.user.id))
+        logger.info('Logged in as %s (with %s status); ID = %s…', self.user, self.user_status, self.user.id)
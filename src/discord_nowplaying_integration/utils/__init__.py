@@ -1,6 +1,7 @@
 import asyncio
 from collections import deque
 from datetime import datetime
+from functools import lru_cache
 import logging
 import os
 import sys
@@ -9,7 +10,10 @@ __all__ = (
     'IS_WINDOWS', 'IS_MACOSX', 'IS_LINUX',
     'Formatter',
     'RateLimiter', 'Queue', 'either',
-    'truncate', 'format_status_message',
+    'ELLIPSIS', 'ELLIPSIS_BYTES',
+    'STATUS_MESSAGE_SEPARATOR', 'STATUS_MESSAGE_SUFFIX', 'STATUS_MESSAGE_PLACEHOLDER',
+    'STATUS_MESSAGE_MAX_BYTES', 'STATUS_MESSAGE_MAX_BYTES_AVAILABLE', 'STATUS_MESSAGE_MIN_ARTIST_BYTES_WHEN_TRUNCATED',
+    'truncate', 'truncate_encoded', 'format_status_message',
 )
 
 
@@ -43,53 +47,55 @@ class RateLimiter:
         self._expiration_timestamps = deque(maxlen=quota)
 
     async def __aenter__(self):
+        # One snapshot will do; the expiration timestamps are monotonic…
+        now = self._loop.time()
+
         # Prune expired expiration timestamps…
-        while len(self._expiration_timestamps) and (self._expiration_timestamps[0] <= self._loop.time()):
+        while self._expiration_timestamps and (self._expiration_timestamps[0] <= now):
             self._expiration_timestamps.popleft()
 
         # If we're at our quota, then we'll have to wait…
         if len(self._expiration_timestamps) == self._expiration_timestamps.maxlen:
-            await asyncio.sleep(self._expiration_timestamps.popleft() - self._loop.time(), loop=self._loop)
-
-        # Going in, we should be strictly under quota…
-        assert len(self._expiration_timestamps) < self._expiration_timestamps.maxlen
+            await asyncio.sleep(self._expiration_timestamps.popleft() - now, loop=self._loop)
 
     async def __aexit__(self, *exc_info):
-        # Coming out, we should be strictly under quota…
-        assert len(self._expiration_timestamps) < self._expiration_timestamps.maxlen
-
         # Only append an expiration timestamp if we came out exception-free…
         if exc_info == (None, None, None):
             self._expiration_timestamps.append(self._loop.time() + self._interval)
 
 
 class Queue:
-    __slots__ = ('_loop', '_rate_limiter', '_cv', '_deque', '_last_popped_item')
+    __slots__ = ('_loop', '_rate_limiter', '_queue', '_last_item', '_last_popped_item')
 
     def __init__(self, rate_limiter, maxlen=None, loop=None):
         self._loop = loop or asyncio.get_event_loop()
         self._rate_limiter = rate_limiter
-        self._cv = asyncio.Condition(loop=self._loop)
-        self._deque = deque(maxlen=maxlen)
+        self._queue = asyncio.Queue(maxsize=(maxlen or 0), loop=self._loop)
+        # The most recently enqueued item (which, once the queue drains, is also the most recently popped one)…
+        self._last_item = None
         self._last_popped_item = None
 
-    @property
-    def _last_item(self):
-        return (self._deque[-1] if len(self._deque) else self._last_popped_item)
-
-    async def _put(self, item):
-        async with self._cv:
-            if item != self._last_item:
-                self._deque.append(item)
-                self._cv.notify()
+    def _put(self, item):
+        last_item = self._last_item
+        # Identity and (cached) hashes settle most comparisons before we resort to comparing character by character…
+        if (item is not last_item) and ((hash(item) != hash(last_item)) or (item != last_item)):
+            # Like a bounded ``deque``, make room by discarding the oldest item…
+            if self._queue.full():
+                self._queue.get_nowait()
+                # …but if that leaves us right back where the consumer last was (e.g., a pause and resume in quick succession), there's nothing new to hand over…
+                if self._queue.empty() and (item == self._last_popped_item):
+                    self._last_item = item
+                    return
+            self._queue.put_nowait(item)
+            self._last_item = item
 
     def put(self, item):
-        asyncio.run_coroutine_threadsafe(self._put(item), self._loop).result()
+        # Fire and forget; there's no need to hold up the producer until the loop gets around to it…
+        self._loop.call_soon_threadsafe(self._put, item)
 
     async def get(self):
-        async with self._rate_limiter, self._cv:
-            await self._cv.wait_for(lambda: len(self._deque))
-            self._last_popped_item = self._deque.popleft()
+        async with self._rate_limiter:
+            self._last_popped_item = await self._queue.get()
             return self._last_popped_item
 
 
@@ -104,6 +110,21 @@ async def either(first_awaitable, second_awaitable):
     return (first_result, second_result)
 
 
+################################################################################################################################################################
+
+ELLIPSIS = '[…]'.encode()
+ELLIPSIS_BYTES = len(ELLIPSIS)
+
+STATUS_MESSAGE_SEPARATOR = ' (by '.encode()
+STATUS_MESSAGE_SUFFIX = ')'.encode()
+STATUS_MESSAGE_PLACEHOLDER = '[unknown]'.encode()
+
+STATUS_MESSAGE_MAX_BYTES = 128
+STATUS_MESSAGE_MAX_BYTES_AVAILABLE = STATUS_MESSAGE_MAX_BYTES - len(STATUS_MESSAGE_SEPARATOR) - len(STATUS_MESSAGE_SUFFIX)
+STATUS_MESSAGE_MIN_ARTIST_BYTES_WHEN_TRUNCATED = 30
+assert STATUS_MESSAGE_MIN_ARTIST_BYTES_WHEN_TRUNCATED < STATUS_MESSAGE_MAX_BYTES_AVAILABLE  # Remember, titles take up at least a byte.
+
+
 ################################################################################################################################################################
 
 def truncate(string, max_bytes):
@@ -123,6 +144,14 @@ def truncate(string, max_bytes):
     >>> truncate('lorem ipsum dolor sit amet', 23)
     'lorem ipsum dolor […]'
 
+    Any whitespace counts as a word boundary, not just plain spaces:
+    >>> truncate('adddxd cdaxb\tbddbxaxdx', 21)
+    'adddxd cdaxb […]'
+    >>> truncate('lorem ipsum\xa0dolor sit', 19)
+    'lorem ipsum […]'
+    >>> truncate('assai\u3000vivace\u3000fin', 19)
+    'assai […]'
+
     Otherwise, break apart the word:
     >>> truncate('howdeedoodeethere', 11)
     'howdee[…]'
@@ -136,30 +165,49 @@ def truncate(string, max_bytes):
     AssertionError: max_bytes ≱ 5
     """
 
-    # These should really be constants, but meh…
-    ellipsis = '[…]'
-    space = ' '
-    ellipsis_bytes = len(ellipsis.encode())
-    max_bytes_available_when_truncated = max_bytes - ellipsis_bytes
-    assert max_bytes_available_when_truncated >= 0, 'max_bytes ≱ {0:d}'.format(ellipsis_bytes)
+    encoded = string.encode()
+    truncated = truncate_encoded(encoded, max_bytes)
+    # If we were within budget, don't bother round-tripping through the codec…
+    return (string if (truncated is encoded) else truncated.decode())
 
-    # If we're within budget, brill…
-    if len(string.encode()) <= max_bytes:
-        return string
 
-    # Cut things down to size. If we snip across a multibyte character, we've asked the decoder to turn a blind eye…
-    string = string.encode()[:max_bytes_available_when_truncated].decode(errors='ignore')
+def truncate_encoded(encoded, max_bytes):
+    """
+    Like ``truncate``, but operates on (and returns) UTF-8 encoded bytes, so callers can reuse the encoding and its length.
+
+    >>> truncate_encoded('lorem ipsum dolor sit amet'.encode(), 23)
+    b'lorem ipsum dolor [\\xe2\\x80\\xa6]'
+
+    Multibyte characters are never snipped in half:
+    >>> truncate_encoded('howdeedoodéethere'.encode(), 16).decode()
+    'howdeedood[…]'
+    """
+
+    max_bytes_available_when_truncated = max_bytes - ELLIPSIS_BYTES
+    assert max_bytes_available_when_truncated >= 0, 'max_bytes ≱ {0:d}'.format(ELLIPSIS_BYTES)
+
+    # If we're within budget, brill…
+    if len(encoded) <= max_bytes:
+        return encoded
+
+    # Cut things down to size, backing up so as not to snip across a multibyte character (i.e. leave no continuation bytes at the cut)…
+    cut = max_bytes_available_when_truncated
+    while (encoded[cut] & 0xC0) == 0x80:
+        cut -= 1
+    # Words may well be separated by non-ASCII whitespace, so look for them in the (cleanly cut, thus strictly decodable) string…
+    string = encoded[:cut].decode()
     # If the string (is non-empty and) ends with a "partial" word, then lob that off…
     if string and (not string[-1].isspace()):
         split = string.rsplit(maxsplit=1)
         if len(split) == 2:
-            string = split[0] + space
+            string = split[0] + ' '
     # Finally, tack on the ellipsis, and call it a day…
-    truncated_string = string + ellipsis
-    assert len(truncated_string.encode()) <= max_bytes
-    return truncated_string
+    truncated_encoded = string.encode() + ELLIPSIS
+    assert len(truncated_encoded) <= max_bytes
+    return truncated_encoded
 
 
+@lru_cache(maxsize=64)  # Tracks get replayed, paused and resumed; no need to redo the byte arithmetic each time…
 def format_status_message(artist, title):
     r"""
     Formats the supplied artist and title into an acceptable user presence game name.
@@ -186,33 +234,25 @@ def format_status_message(artist, title):
     '[unknown] (by [unknown])'
     """
 
-    # These should really be constants, but meh…
-    separator = ' (by '
-    suffix = ')'
-    unknown = '[unknown]'
-    min_artist_bytes_when_truncated = 30
-    max_bytes = 128
-    max_bytes_available = max_bytes - len(separator.encode()) - len(suffix.encode())
-    assert min_artist_bytes_when_truncated < max_bytes_available  # Remember, titles take up at least a byte.
-
-    artist = artist.strip() or unknown
-    title = title.strip() or unknown
+    # Encode each field exactly once; from here on out, everything's bytes…
+    artist = artist.strip().encode() or STATUS_MESSAGE_PLACEHOLDER
+    title = title.strip().encode() or STATUS_MESSAGE_PLACEHOLDER
 
-    artist_bytes = len(artist.encode())
-    title_bytes = len(title.encode())
-    bytes_left = max_bytes_available - artist_bytes - title_bytes
+    artist_bytes = len(artist)
+    title_bytes = len(title)
+    bytes_left = STATUS_MESSAGE_MAX_BYTES_AVAILABLE - artist_bytes - title_bytes
 
     # If we're over budget…
     if bytes_left < 0:
         # … cut the artist down to size, if necessary…
-        if artist_bytes > min_artist_bytes_when_truncated:
-            artist = truncate(artist, max(min_artist_bytes_when_truncated, artist_bytes + bytes_left))
-            artist_bytes = len(artist.encode())
-            bytes_left = max_bytes_available - artist_bytes - title_bytes
+        if artist_bytes > STATUS_MESSAGE_MIN_ARTIST_BYTES_WHEN_TRUNCATED:
+            artist = truncate_encoded(artist, max(STATUS_MESSAGE_MIN_ARTIST_BYTES_WHEN_TRUNCATED, artist_bytes + bytes_left))
+            artist_bytes = len(artist)
+            bytes_left = STATUS_MESSAGE_MAX_BYTES_AVAILABLE - artist_bytes - title_bytes
         # … then cut the title down to size, if necessary…
         if bytes_left < 0:
-            title = truncate(title, title_bytes + bytes_left)
+            title = truncate_encoded(title, title_bytes + bytes_left)
 
-    status_message = title + separator + artist + suffix
-    assert len(status_message.encode()) <= max_bytes
-    return status_message
+    status_message = title + STATUS_MESSAGE_SEPARATOR + artist + STATUS_MESSAGE_SUFFIX
+    assert len(status_message) <= STATUS_MESSAGE_MAX_BYTES
+    return status_message.decode()